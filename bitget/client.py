@@ -1,12 +1,98 @@
 import time
-import hmac
+import threading
 import base64
 import hashlib
 import requests
-import json
-from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+import orjson
+from urllib.parse import urlencode, quote_plus
+
+from bitget.utils import format_number
+
+# XOR translation tables for the HMAC inner/outer pads (RFC 2104)
+_TRANS_36 = bytes(x ^ 0x36 for x in range(256))
+_TRANS_5C = bytes(x ^ 0x5C for x in range(256))
+
+def _hmac_sha256_pads(secret):
+    """
+    Build the keyed HMAC-SHA256 inner and outer hash states for a secret
+    
+    Uses hashlib.sha256 directly, which is backed by OpenSSL's EVP
+    implementation (and SHA-NI where the CPU supports it).
+    
+    Parameters:
+    - secret: API secret string
+    
+    Returns:
+    - Tuple of (inner, outer) hashlib objects, ready to be copied
+    """
+    key = secret.encode('utf-8')
+    if len(key) > 64:
+        key = hashlib.sha256(key).digest()
+    key = key.ljust(64, b'\x00')
+    return (hashlib.sha256(key.translate(_TRANS_36)),
+            hashlib.sha256(key.translate(_TRANS_5C)))
+
+class _RateLimiter:
+    """
+    Space out calls so that at most a given number start per second
+    """
+    __slots__ = ('_interval', '_next_time', '_lock')
+    
+    def __init__(self, rate):
+        """
+        Initialize the rate limiter
+        
+        Parameters:
+        - rate: Maximum number of calls per second
+        """
+        self._interval = 1.0 / rate
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """
+        Block until the caller may make its next call
+        """
+        # Reserve the next free slot under the lock, then sleep outside it
+        # so other threads can queue up behind this one
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + self._interval
+        if start > now:
+            time.sleep(start - now)
 
 class BitgetClient:
+    # Seconds that the bulk ticker snapshot is reused for
+    TICKER_CACHE_TTL = 0.5
+    
+    # Seconds that balance and position responses are reused for; risk
+    # checks don't need fresher data, and placing an order invalidates them
+    ACCOUNT_CACHE_TTL = 2.0
+    
+    # Requests per second allowed for each rate-limited endpoint (Bitget's
+    # per-UID limits); every other endpoint shares DEFAULT_RATE_LIMIT
+    RATE_LIMITS = {
+        "/order/placeOrder": 10,
+        "/plan/placePlan": 10,
+        "/account/setLeverage": 5
+    }
+    DEFAULT_RATE_LIMIT = 10
+    
+    # Maximum number of requests in flight at once across all threads; this
+    # bounds concurrency only, the per-second limits come from RATE_LIMITS
+    MAX_IN_FLIGHT = 8
+    
+    # Fixed attribute layout: faster attribute access on the request path
+    # and no per-instance __dict__
+    __slots__ = (
+        'api_key', 'api_secret', 'passphrase', 'debug', 'is_futures',
+        'session', '_base_url', '_endpoint_url', '_base_headers',
+        '_ipad', '_opad', '_sig_prefix', '_rate_limiters',
+        '_default_rate_limiter', '_request_slots', '_cache'
+    )
+    
     def __init__(self, api_key, api_secret, passphrase, is_futures=True, debug=True):
         """
         Initialize the Bitget API client
@@ -23,6 +109,14 @@ class BitgetClient:
         self.passphrase = passphrase.strip()
         self.debug = debug
         
+        # Headers shared by every authenticated request; only the signature
+        # and timestamp are added per call
+        self._base_headers = {
+            'ACCESS-KEY': self.api_key,
+            'ACCESS-PASSPHRASE': self.passphrase,
+            'Content-Type': 'application/json'
+        }
+        
         # Default base URLs - these might need to be updated based on current Bitget API structure
         if is_futures:
             self.base_url = "https://api.bitget.com/api/mix/v1"
@@ -31,6 +125,42 @@ class BitgetClient:
         
         self.is_futures = is_futures
         self.session = requests.Session()
+        
+        # Keep a sized pool of keep-alive connections so concurrent order
+        # placement reuses TLS sessions instead of handshaking per request
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, pool_block=False)
+        self.session.mount('https://', adapter)
+        
+        # Precompute the HMAC-SHA256 inner/outer pad states once, since the
+        # secret is fixed for the session; each signature only copies them
+        self._ipad, self._opad = _hmac_sha256_pads(self.api_secret)
+        
+        # Encoded method + path signature prefixes, filled per endpoint
+        self._sig_prefix = {}
+        
+        # One limiter per endpoint group, shared by all threads using the client
+        self._rate_limiters = {
+            endpoint: _RateLimiter(rate) for endpoint, rate in self.RATE_LIMITS.items()
+        }
+        self._default_rate_limiter = _RateLimiter(self.DEFAULT_RATE_LIMIT)
+        self._request_slots = threading.BoundedSemaphore(self.MAX_IN_FLIGHT)
+        
+        # Short-lived response cache: (category, ...) -> (expiry on the
+        # monotonic clock, value)
+        self._cache = {}
+    
+    @property
+    def base_url(self):
+        """
+        Base URL that endpoint paths are appended to
+        """
+        return self._base_url
+    
+    @base_url.setter
+    def base_url(self, url):
+        # Full endpoint URLs are cached per base URL, so start a fresh cache
+        self._base_url = url
+        self._endpoint_url = {}
     
     def try_alternate_base_urls(self):
         """
@@ -72,7 +202,7 @@ class BitgetClient:
                 try:
                     # First try: common endpoint for market data
                     endpoint = "/market/contracts" if self.is_futures else "/market/symbols"
-                    response = self._request("GET", endpoint, skip_auth=True)
+                    response = self._request("GET", endpoint, skip_auth=True, check_code=False)
                     if self.debug:
                         print(f"✅ Success with base URL: {url} using endpoint {endpoint}")
                     return True
@@ -82,7 +212,7 @@ class BitgetClient:
                     
                     # Second try: time endpoint
                     endpoint = "/public/time"
-                    response = self._request("GET", endpoint, skip_auth=True)
+                    response = self._request("GET", endpoint, skip_auth=True, check_code=False)
                     if self.debug:
                         print(f"✅ Success with base URL: {url} using endpoint {endpoint}")
                     return True
@@ -98,40 +228,59 @@ class BitgetClient:
             print("\n❌ Unable to find a working Bitget API URL")
         return False
     
-    def _generate_signature(self, timestamp, method, request_path, body=''):
+    def _generate_signature(self, timestamp, method, request_path, body_bytes=b''):
         """
         Generate BitGet signature for API authentication
         
         Parameters:
-        - timestamp: Current timestamp in milliseconds
-        - method: HTTP method (GET, POST, etc.)
+        - timestamp: Current timestamp in milliseconds, as a string
+        - method: HTTP method in uppercase (GET, POST, etc.)
         - request_path: API endpoint path
-        - body: Request body (for POST requests)
+        - body_bytes: Serialized request body (empty bytes if there is none)
         
         Returns:
         - Base64 encoded signature
         """
-        # For empty body, use empty string instead of JSON
-        body_str = json.dumps(body) if body else ''
+        # The method + path part is constant per endpoint, so it is encoded
+        # once and reused
+        prefix = self._sig_prefix.get((method, request_path))
+        if prefix is None:
+            prefix = self._sig_prefix[(method, request_path)] = (method + request_path).encode('utf-8')
         
-        # Construct the message (method must be uppercase)
-        message = str(timestamp) + method.upper() + request_path + body_str
+        # Construct the message directly as bytes in a single join, so the
+        # body is hashed as sent without a decode/concatenate/encode cycle
+        message = b''.join((timestamp.encode('ascii'), prefix, body_bytes))
         
         if self.debug:
-            print(f"DEBUG: Signature message: {message}")
+            print(f"DEBUG: Signature message: {message.decode('utf-8')}")
             
-        # Generate the HMAC-SHA256 signature
-        signature = base64.b64encode(
-            hmac.new(
-                self.api_secret.encode('utf-8'),
-                message.encode('utf-8'),
-                hashlib.sha256
-            ).digest()
-        ).decode('utf-8')
+        # Generate the HMAC-SHA256 signature from the precomputed pad states
+        inner = self._ipad.copy()
+        inner.update(message)
+        outer = self._opad.copy()
+        outer.update(inner.digest())
+        signature = base64.b64encode(outer.digest()).decode('utf-8')
         
         return signature
     
-    def _request(self, method, endpoint, params=None, data=None, skip_auth=False):
+    def _public_request(self, method, endpoint, params=None):
+        """
+        Make unsigned request to a public BitGet API endpoint
+        
+        The response code is still validated, unlike the endpoint probing
+        done by try_alternate_base_urls.
+        
+        Parameters:
+        - method: HTTP method (GET, POST, etc.)
+        - endpoint: API endpoint path
+        - params: Query parameters
+        
+        Returns:
+        - API response as JSON
+        """
+        return self._request(method, endpoint, params=params, skip_auth=True)
+    
+    def _request(self, method, endpoint, params=None, data=None, skip_auth=False, check_code=True):
         """
         Make authenticated request to BitGet API
         
@@ -141,36 +290,49 @@ class BitgetClient:
         - params: Query parameters for GET requests
         - data: Request body for POST requests
         - skip_auth: Whether to skip authentication (for public endpoints)
+        - check_code: Whether to treat a non-'00000' response code as an error
         
         Returns:
         - API response as JSON
         """
-        url = self.base_url + endpoint
-        timestamp = str(int(time.time() * 1000))
+        # Wait for the endpoint's rate limit first, so the timestamp is fresh
+        # and throttled threads don't hold an in-flight slot while sleeping
+        self._rate_limiters.get(endpoint, self._default_rate_limiter).wait()
+        
+        url = self._endpoint_url.get(endpoint)
+        if url is None:
+            url = self._endpoint_url[endpoint] = self._base_url + endpoint
+        timestamp = str(time.time_ns() // 1_000_000)
+        
+        # Serialize the body once; the same bytes are signed and sent
+        body_bytes = orjson.dumps(data) if data else b''
         
         # Add query parameters to URL if provided
         query_string = ""
         if params:
-            query_string = urlencode(params)
+            if len(params) == 1:
+                # Single-parameter GETs (e.g. market price lookups) skip
+                # urlencode's per-pair list building
+                (key, value), = params.items()
+                query_string = key + '=' + quote_plus(str(value))
+            else:
+                query_string = urlencode(params)
             url = url + '?' + query_string
         
-        # Prepare headers
-        headers = {
-            'Content-Type': 'application/json'
-        }
-        
-        # Add authentication headers if needed
-        if not skip_auth:
+        # Prepare headers, adding authentication headers if needed
+        if skip_auth:
+            headers = {
+                'Content-Type': 'application/json'
+            }
+        else:
             # Generate signature
-            signature = self._generate_signature(timestamp, method, endpoint, data)
+            signature = self._generate_signature(timestamp, method, endpoint, body_bytes)
             
-            # Add auth headers
-            headers.update({
-                'ACCESS-KEY': self.api_key,
+            headers = {
+                **self._base_headers,
                 'ACCESS-SIGN': signature,
-                'ACCESS-TIMESTAMP': timestamp,
-                'ACCESS-PASSPHRASE': self.passphrase
-            })
+                'ACCESS-TIMESTAMP': timestamp
+            }
             
         # Debug logging
         if self.debug:
@@ -179,33 +341,37 @@ class BitgetClient:
             print(f"DEBUG: Headers:")
             for key, value in headers.items():
                 if key == 'ACCESS-PASSPHRASE':
-                    masked_value = value[:3] + '*' * (len(value) - 3)
-                    print(f"  {key}: {masked_value}")
-                elif key == 'ACCESS-SIGN':
-                    print(f"  {key}: {value}")
-                else:
-                    print(f"  {key}: {value}")
-            if data:
-                print(f"DEBUG: Data: {json.dumps(data)}")
+                    value = value[:3] + '*' * (len(value) - 3)
+                print(f"  {key}: {value}")
+            if body_bytes:
+                print(f"DEBUG: Data: {body_bytes.decode('utf-8')}")
         
         # Make request
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=data
-            )
+            with self._request_slots:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    data=body_bytes or None
+                )
             
             # Debug response
             if self.debug:
                 print(f"DEBUG: Response status: {response.status_code}")
-                print(f"DEBUG: Response body: {response.text[:2000]}")  # Limit to 2000 chars
+                # Slice the raw bytes before decoding rather than decoding the
+                # whole body through response.text (limit to 2000 bytes)
+                print(f"DEBUG: Response body: {response.content[:2000].decode('utf-8', errors='replace')}")
             
             # Handle response
             if response.status_code == 200:
-                resp_json = response.json()
-                if not skip_auth and resp_json.get('code') != '00000' and 'code' in resp_json:
+                try:
+                    resp_json = orjson.loads(response.content)
+                except orjson.JSONDecodeError:
+                    # orjson is stricter than the stdlib parser (e.g. NaN or
+                    # integers beyond 64 bits), so fall back before failing
+                    resp_json = response.json()
+                if check_code and resp_json.get('code') != '00000' and 'code' in resp_json:
                     error_message = f"API request failed: {response.text}"
                     print(error_message)
                     raise Exception(error_message)
@@ -220,6 +386,37 @@ class BitgetClient:
             print(error_message)
             raise Exception(error_message)
     
+    def _cached(self, key, ttl, loader):
+        """
+        Return a cached value, calling loader to refresh it once expired
+        
+        Parameters:
+        - key: Cache key, a tuple starting with its category
+        - ttl: Seconds the loaded value stays valid
+        - loader: Callable producing a fresh value
+        
+        Returns:
+        - Cached or freshly loaded value
+        """
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        value = loader()
+        self._cache[key] = (now + ttl, value)
+        return value
+    
+    def _invalidate_cache(self, *categories):
+        """
+        Drop cached responses so the next lookup fetches fresh data
+        
+        Parameters:
+        - categories: Cache key categories to drop (e.g., "positions")
+        """
+        for key in list(self._cache):
+            if key[0] in categories:
+                self._cache.pop(key, None)
+    
     # Trading methods
     def place_order(self, symbol, side, order_type, price=None, size=None, leverage=None):
         """
@@ -244,18 +441,20 @@ class BitgetClient:
             "marginCoin": "USDT",     # Margin currency
             "side": side,             # "buy" or "sell"
             "orderType": order_type,  # "limit" or "market"
-            "size": str(size)         # Contract quantity
+            "size": format_number(size)  # Contract quantity
         }
         
         # Add price for limit orders
         if order_type == "limit" and price is not None:
-            data["price"] = str(price)
+            data["price"] = format_number(price)
             
         # Set leverage if provided
         if leverage is not None:
             self.set_leverage(symbol, leverage)
             
-        return self._request("POST", endpoint, data=data)
+        response = self._request("POST", endpoint, data=data)
+        self._invalidate_cache("balance", "positions")
+        return response
     
     def set_leverage(self, symbol, leverage):
         """
@@ -272,7 +471,7 @@ class BitgetClient:
         data = {
             "symbol": symbol,
             "marginCoin": "USDT",
-            "leverage": str(leverage)
+            "leverage": format_number(leverage)
         }
         return self._request("POST", endpoint, data=data)
     
@@ -284,13 +483,17 @@ class BitgetClient:
         - symbol: (Optional) Trading pair symbol to filter positions
         
         Returns:
-        - List of current positions
+        - List of current positions (cached for ACCOUNT_CACHE_TTL seconds)
         """
         endpoint = "/position/allPosition"
         params = {"marginCoin": "USDT"}
         if symbol:
             params["symbol"] = symbol
-        return self._request("GET", endpoint, params=params)
+        return self._cached(
+            ("positions", symbol),
+            self.ACCOUNT_CACHE_TTL,
+            lambda: self._request("GET", endpoint, params=params)
+        )
     
     def place_stop_order(self, symbol, side, size, trigger_price, price=None):
         """
@@ -311,16 +514,18 @@ class BitgetClient:
             "symbol": symbol,
             "marginCoin": "USDT",
             "side": side,
-            "size": str(size),
-            "triggerPrice": str(trigger_price),
+            "size": format_number(size),
+            "triggerPrice": format_number(trigger_price),
             "triggerType": "market_price",
             "orderType": "market" if price is None else "limit"
         }
         
         if price is not None:
-            data["executePrice"] = str(price)
+            data["executePrice"] = format_number(price)
             
-        return self._request("POST", endpoint, data=data)
+        response = self._request("POST", endpoint, data=data)
+        self._invalidate_cache("balance", "positions")
+        return response
     
     def get_market_price(self, symbol):
         """
@@ -334,21 +539,41 @@ class BitgetClient:
         """
         endpoint = "/market/ticker"
         params = {"symbol": symbol}
-        response = self._request("GET", endpoint, params=params)
+        # Market data is public, so skip signing the request
+        response = self._public_request("GET", endpoint, params=params)
         return float(response['data']['last'])
     
+    def get_all_market_prices(self):
+        """
+        Get current market prices for all futures symbols in a single request
+        
+        The snapshot is cached for TICKER_CACHE_TTL seconds so that rapid
+        monitoring cycles don't re-fetch it.
+        
+        Returns:
+        - Dict mapping symbol to current market price as float
+        """
+        def fetch():
+            response = self._public_request("GET", "/market/tickers", params={"productType": "umcbl"})
+            return {ticker['symbol']: float(ticker['last']) for ticker in response['data']}
+        
+        return self._cached(("tickers",), self.TICKER_CACHE_TTL, fetch)
+    
     def get_account_balance(self):
         """
         Get account balance
         
         Returns:
-        - Available USDT balance
+        - Available USDT balance (cached for ACCOUNT_CACHE_TTL seconds)
         """
-        response = self._request("GET", "/account/accounts", params={"productType": "umcbl"})
-        for acct in response['data']:
-            if acct['marginCoin'] == 'USDT':
-                return float(acct['available'])
-        return 0.0
+        def fetch():
+            response = self._request("GET", "/account/accounts", params={"productType": "umcbl"})
+            for acct in response['data']:
+                if acct['marginCoin'] == 'USDT':
+                    return float(acct['available'])
+            return 0.0
+        
+        return self._cached(("balance",), self.ACCOUNT_CACHE_TTL, fetch)
     
     def get_pending_orders(self):
         """
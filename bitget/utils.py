@@ -1,3 +1,6 @@
+from decimal import Decimal
+from functools import lru_cache
+
 def round_to_increment(value, increment):
     """
     Round a value to the nearest increment
@@ -11,6 +14,38 @@ def round_to_increment(value, increment):
     """
     return round(value / increment) * increment
 
+@lru_cache(maxsize=None)
+def increment_decimals(increment):
+    """
+    Get the number of decimal places implied by an increment
+    
+    Parameters:
+    - increment: Minimum price or size increment (e.g., 0.001)
+    
+    Returns:
+    - Number of decimal places (e.g., 3)
+    """
+    exponent = Decimal(str(increment)).normalize().as_tuple().exponent
+    return max(0, -exponent)
+
+def format_number(value):
+    """
+    Format a number as a plain decimal string for API requests
+    
+    Parameters:
+    - value: Number to format (strings are returned unchanged)
+    
+    Returns:
+    - Number as a string, never in scientific notation
+    """
+    if isinstance(value, str):
+        return value
+    text = str(value)
+    # Only very small or very large floats need the slower Decimal path
+    if 'e' in text:
+        text = format(Decimal(text), 'f')
+    return text
+
 def format_price(price, tick_size):
     """
     Format a price according to the symbol's tick size
@@ -22,7 +57,7 @@ def format_price(price, tick_size):
     Returns:
     - Formatted price as string
     """
-    return str(round_to_increment(price, tick_size))
+    return f"{round_to_increment(price, tick_size):.{increment_decimals(tick_size)}f}"
 
 def format_size(size, base_increment):
     """
@@ -35,7 +70,7 @@ def format_size(size, base_increment):
     Returns:
     - Formatted size as string
     """
-    return str(round_to_increment(size, base_increment))
+    return f"{round_to_increment(size, base_increment):.{increment_decimals(base_increment)}f}"
 
 def calculate_position_size(entry_price, stop_loss, risk_amount, leverage):
     """
@@ -50,14 +85,9 @@ def calculate_position_size(entry_price, stop_loss, risk_amount, leverage):
     Returns:
     - Position size in contracts
     """
-    price_risk = abs(entry_price - stop_loss)
-    risk_percentage = price_risk / entry_price
-    
-    # Calculate position size in contracts
-    position_size_usd = risk_amount * leverage
-    position_size_contracts = position_size_usd / entry_price
-    
-    return position_size_contracts
+    # Calculate position size in contracts (the stop distance does not
+    # affect the notional size, which is fixed by risk amount and leverage)
+    return risk_amount * leverage / entry_price
 
 def timestamp_to_date(timestamp):
     """
@@ -1,6 +1,10 @@
-from bitget.utils import round_to_increment, calculate_position_size
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from bitget.utils import round_to_increment, calculate_position_size, format_price, format_size
 
 class TradingStrategy:
+    __slots__ = ('client', 'risk_per_trade', 'leverage', 'trade_opportunities', '_trades_by_symbol')
+    
     def __init__(self, client, trade_opportunities, risk_per_trade=6.0, leverage=10):
         """
         Initialize the trading strategy
@@ -15,6 +19,7 @@ class TradingStrategy:
         self.risk_per_trade = risk_per_trade  # Amount to risk per trade in USD
         self.leverage = leverage
         self.trade_opportunities = trade_opportunities
+        self._trades_by_symbol = {t["symbol"]: t for t in trade_opportunities}
     
     def execute_trade(self, trade):
         """
@@ -39,6 +44,8 @@ class TradingStrategy:
             self.leverage
         )
         position_size = round_to_increment(raw_position_size, trade["base_increment"])
+        # Order sizes are sent with exactly the increment's decimal places
+        position_size_str = format_size(position_size, trade["base_increment"])
         
         print(f"\nExecuting trade for {symbol}:")
         print(f"Entry: {entry_price}, Target: {target_price}, Stop Loss: {stop_loss}")
@@ -54,52 +61,76 @@ class TradingStrategy:
                 side="buy",
                 order_type="limit",
                 price=entry_price,
-                size=position_size
+                size=position_size_str
             )
-            print(f"Entry order placed: {entry_order}")
+            print(f"{symbol}: Entry order placed: {entry_order}")
             
             # Calculate partial take profit level (50% of the way to target)
-            partial_tp = entry_price + (target_price - entry_price) / 2
-            partial_tp = round(partial_tp / trade["tick_size"]) * trade["tick_size"]
-            
-            # Place partial take profit order (50% of position)
-            partial_tp_size = round_to_increment(position_size / 2, trade["base_increment"])
-            tp_order_1 = self.client.place_stop_order(
-                symbol=symbol,
-                side="sell",
-                size=partial_tp_size,
-                trigger_price=partial_tp
-            )
-            print(f"Partial take profit order placed at {partial_tp}: {tp_order_1}")
-            
-            # Place final take profit order (remaining 50% of position)
-            tp_order_2 = self.client.place_stop_order(
-                symbol=symbol,
-                side="sell",
-                size=partial_tp_size,
-                trigger_price=target_price
-            )
-            print(f"Final take profit order placed at {target_price}: {tp_order_2}")
+            # snapped to the tick size's decimal places
+            partial_tp = format_price(entry_price + (target_price - entry_price) / 2, trade["tick_size"])
             
-            # Place stop loss order
-            sl_order = self.client.place_stop_order(
-                symbol=symbol,
-                side="sell",
-                size=position_size,
-                trigger_price=stop_loss
-            )
-            print(f"Stop loss order placed at {stop_loss}: {sl_order}")
+            # The take profit and stop loss orders are independent of each
+            # other, so place all three concurrently once the entry is in
+            partial_tp_size = format_size(position_size / 2, trade["base_increment"])
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                # Partial take profit order (50% of position)
+                tp_future_1 = executor.submit(
+                    self.client.place_stop_order,
+                    symbol=symbol,
+                    side="sell",
+                    size=partial_tp_size,
+                    trigger_price=partial_tp
+                )
+                
+                # Final take profit order (remaining 50% of position)
+                tp_future_2 = executor.submit(
+                    self.client.place_stop_order,
+                    symbol=symbol,
+                    side="sell",
+                    size=partial_tp_size,
+                    trigger_price=target_price
+                )
+                
+                # Stop loss order
+                sl_future = executor.submit(
+                    self.client.place_stop_order,
+                    symbol=symbol,
+                    side="sell",
+                    size=position_size_str,
+                    trigger_price=stop_loss
+                )
+                
+                wait([tp_future_1, tp_future_2, sl_future])
             
-            return {
+            # Collect every outcome, so orders that did go through are still
+            # reported (and can be managed) when another one failed
+            stop_orders = [
+                ("partial_tp_order", f"{symbol}: Partial take profit order placed at {partial_tp}", tp_future_1),
+                ("final_tp_order", f"{symbol}: Final take profit order placed at {target_price}", tp_future_2),
+                ("stop_loss_order", f"{symbol}: Stop loss order placed at {stop_loss}", sl_future)
+            ]
+            result = {
                 "status": "success",
-                "entry_order": entry_order,
-                "partial_tp_order": tp_order_1,
-                "final_tp_order": tp_order_2,
-                "stop_loss_order": sl_order
+                "entry_order": entry_order
             }
+            errors = []
+            for key, description, future in stop_orders:
+                error = future.exception()
+                if error is None:
+                    result[key] = future.result()
+                    print(f"{description}: {result[key]}")
+                else:
+                    errors.append(f"{key}: {error}")
+            
+            if errors:
+                result["status"] = "error"
+                result["error"] = "; ".join(errors)
+                print(f"Error executing trade for {symbol}: {result['error']}")
+            
+            return result
             
         except Exception as e:
-            print(f"Error executing trade: {e}")
+            print(f"Error executing trade for {symbol}: {e}")
             return {
                 "status": "error",
                 "error": str(e)
@@ -116,13 +147,19 @@ class TradingStrategy:
         - List of trade execution results
         """
         trades_to_execute = filtered_trades if filtered_trades else self.trade_opportunities
-        results = []
+        if not trades_to_execute:
+            return []
+        
+        # Each trade is a chain of network round-trips, so run the symbols
+        # concurrently; the client caps how many requests are in flight
+        with ThreadPoolExecutor(max_workers=min(8, len(trades_to_execute))) as executor:
+            futures = [executor.submit(self.execute_trade, trade) for trade in trades_to_execute]
         
-        for trade in trades_to_execute:
-            result = self.execute_trade(trade)
+        results = []
+        for trade, future in zip(trades_to_execute, futures):
             results.append({
                 "symbol": trade["symbol"],
-                "result": result
+                "result": future.result()
             })
         
         return results
@@ -132,6 +169,7 @@ class TradingStrategy:
         Update trailing stops for active positions
         """
         positions = self.client.get_positions()
+        prices = None
         
         for position in positions['data']:
             symbol = position['symbol']
@@ -140,16 +178,22 @@ class TradingStrategy:
             # Skip positions with zero size
             if size <= 0:
                 continue
-                
-            entry_price = float(position['averageOpenPrice'])
             
             # Find corresponding trade opportunity
-            trade = next((t for t in self.trade_opportunities if t["symbol"] == symbol), None)
+            trade = self._trades_by_symbol.get(symbol)
             if trade is None:
                 print(f"No trade configuration found for {symbol}, skipping.")
                 continue
             
-            current_price = self.client.get_market_price(symbol)
+            entry_price = float(position['averageOpenPrice'])
+            
+            # Fetch all prices in one request, only once a position needs one
+            if prices is None:
+                prices = self.client.get_all_market_prices()
+            current_price = prices.get(symbol)
+            if current_price is None:
+                current_price = self.client.get_market_price(symbol)
+            
             target = trade["target"]
             half_target = entry_price + (target - entry_price) / 2
             